@@ -1,335 +1,528 @@
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import os
-from config import get_activeplayer_games, OUTPUT_DIR, ACTIVEPLAYER_OUTPUT_FILE
-import time
+import re
+from config import get_activeplayer_games, OUTPUT_DIR
+from utils import parse_number_with_commas, TokenBucket
+import asyncio
+import logging
+import multiprocessing
 import random
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-def parse_number_with_commas(text: str) -> float:
-    if not text or text.strip() == '':
-        return 0.0
-    cleaned = text.replace(',', '').replace('%', '').strip().lower()
-    multiplier = 1
-    if cleaned.endswith('k'):
-        multiplier = 1000
-        cleaned = cleaned[:-1]
-    elif cleaned.endswith('m'):
-        multiplier = 1000000
-        cleaned = cleaned[:-1]
-    elif cleaned.endswith('b'):
-        multiplier = 1000000000
-        cleaned = cleaned[:-1]
-    try:
-        return float(cleaned) * multiplier
-    except ValueError:
-        return 0.0
-
-def create_robust_session():
-    """Create a requests session with retry strategy and proper headers"""
-    session = requests.Session()
-    
-    # Configure retry strategy
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    
-    # Set headers to mimic a real browser
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    })
-    
-    return session
+import time
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# Bump when the parser's expectations about page structure change, so the
+# cache invalidates cleanly instead of feeding stale HTML to new code
+SCHEMA_VERSION = 2
+
+# How long a cached page is served without even a conditional request
+CACHE_EXPIRE_HOURS = 12
+
+# Parquet dataset (partitioned by Game) written under OUTPUT_DIR
+ACTIVEPLAYER_PARQUET_DIR = "activeplayer.parquet"
+
+# Cap concurrent in-flight requests against activeplayer.io to stay polite
+MAX_INFLIGHT_REQUESTS = 4
+
+# Connection limits for the shared HTTP/2 client: a single TLS connection
+# can multiplex every request, with a few spares for good measure
+_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+# Statuses worth retrying, mirroring the old urllib3 Retry config
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Headers that mimic a real browser, applied to the shared client
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Aggregate request rate against activeplayer.io (requests per second);
+# cache hits never touch the bucket, so warm runs are not throttled at all
+_RATE_LIMITER = TokenBucket(rate=4)
+
+# Classifies a header cell as a peak or average/daily player-count column in
+# one compiled scan; the peak alternatives come first so 'Peak Players'
+# never falls through to the generic 'players' match
+HEADER_RE = re.compile(
+    r"(?P<peak>peak|max player|max concurrent)"
+    r"|(?P<avg>daily average|average daily|daily avg|estimated players"
+    r"|monthly average users|players)",
+    re.I,
+)
+
+# Known stats-table variants, in order of preference
+TABLE_KINDS = (
+    "table_2",
+    "table_3",
+    "steam-stats-table",
+    "asdrm-monthly-stats-table",
+    "gst-data-table",
+    "wgs-stats-table",
+    "table-striped",
+)
+
+# Lower value = higher preference when a page carries several table variants
+_TABLE_PRIORITY = {kind: i for i, kind in enumerate(TABLE_KINDS)}
+
+# Compiled once at import so the hot row loop never re-parses the path
+_ROW_CELLS = etree.XPath(".//td")
+
+def _table_kind(el):
+    """Return which known stats-table kind this <table> element is, if any."""
+    el_id = el.get("id")
+    if el_id in ("table_2", "table_3"):
+        return el_id
+    classes = (el.get("class") or "").split()
+    for kind in TABLE_KINDS[2:]:
+        if kind in classes:
+            return kind
+    return None
+
+def _element_text(el) -> str:
+    """Collapse an element's text content, like BS4's get_text(strip=True)."""
+    return "".join(el.itertext()).strip()
+
+def _parse_page_elements(content: bytes):
+    """Stream-parse a page, keeping only stats tables and the pagination div.
+
+    Uses lxml's pull parser so the candidate tables are collected in a
+    single C-level pass; every other table is cleared as soon as it closes,
+    keeping peak memory at O(rows in the tables we care about) instead of
+    the full document tree with all its ads and scripts.
+    """
+    parser = etree.HTMLPullParser(events=("end",))
+    parser.feed(content)
+    parser.close()
+    tables = {}
+    pagination = None
+    for _, el in parser.read_events():
+        if el.tag == "table":
+            kind = _table_kind(el)
+            if kind is not None and kind not in tables:
+                tables[kind] = el
+            elif kind is None:
+                el.clear()
+        elif (el.tag == "div" and pagination is None
+                and "ms-pagination" in (el.get("class") or "")):
+            pagination = el
+    return tables, pagination
+
+class HTTPCache:
+    """Small sqlite-backed HTTP cache with ETag/Last-Modified revalidation.
+
+    Pages fresher than CACHE_EXPIRE_HOURS are served without any request;
+    older entries are revalidated with a conditional GET so unchanged pages
+    cost one cheap 304 instead of a full download.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "fetched_at REAL, body BLOB)"
+        )
+        self._conn.commit()
+
+    def _key(self, url: str) -> str:
+        return f"v{SCHEMA_VERSION}:{url}"
 
-def make_request_with_retry(session, url: str, max_retries: int = 3, base_delay: float = 2.0):
-    """Make HTTP request with retry logic and exponential backoff"""
-    for attempt in range(max_retries):
+    def get(self, url: str):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT etag, last_modified, fetched_at, body FROM pages WHERE key = ?",
+                (self._key(url),),
+            ).fetchone()
+
+    def put(self, url: str, etag: str, last_modified: str, body: bytes):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (self._key(url), etag, last_modified, time.time(), body),
+            )
+            self._conn.commit()
+
+    def touch(self, url: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE key = ?",
+                (time.time(), self._key(url)),
+            )
+            self._conn.commit()
+
+_CACHE = HTTPCache(os.path.join(OUTPUT_DIR, "http_cache.sqlite"))
+
+async def _get_with_retries(client: httpx.AsyncClient, url: str, headers=None, max_retries: int = 3):
+    """GET with rate limiting and status-aware retries.
+
+    httpx has no urllib3-style Retry, so 429/5xx handling (including
+    Retry-After) lives here; connect-level retries are on the transport.
+    Returns the response without raising on 304 so callers can revalidate.
+    """
+    for attempt in range(max_retries + 1):
+        delay = _RATE_LIMITER.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
         try:
-            response = session.get(url, timeout=25)  # Increased timeout
-            response.raise_for_status()
-            return response
-        except requests.exceptions.Timeout:
-            if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff + jitter
-                print(f"    ⏳ Timeout on attempt {attempt + 1}/{max_retries}, retrying in {delay:.1f}s...")
-                time.sleep(delay)
-            else:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt == max_retries:
                 raise
-        except requests.exceptions.RequestException as e:
-            if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                print(f"    ⏳ Request failed on attempt {attempt + 1}/{max_retries}: {e}, retrying in {delay:.1f}s...")
-                time.sleep(delay)
+            await asyncio.sleep(2 ** attempt + random.uniform(0, 0.5))
+            continue
+        if response.status_code in RETRY_STATUSES and attempt < max_retries:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                wait = int(retry_after)
             else:
-                raise
-    return None
+                wait = 2 ** attempt + random.uniform(0, 0.5)
+            await asyncio.sleep(wait)
+            continue
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
 
-def scrape_activeplayer(game_slug: str, game_name: str):
+async def fetch_with_cache(client: httpx.AsyncClient, url: str) -> bytes:
+    """Fetch a page through the disk cache, revalidating stale entries."""
+    cached = _CACHE.get(url)
+    if cached:
+        etag, last_modified, fetched_at, body = cached
+        if time.time() - fetched_at < CACHE_EXPIRE_HOURS * 3600:
+            return body
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            response = await _get_with_retries(client, url, headers=headers)
+        except httpx.HTTPError:
+            # Serve the stale copy rather than failing the whole game
+            log.warning("Request failed, using stale cached copy of %s", url)
+            return body
+        if response.status_code == 304:
+            _CACHE.touch(url)
+            return body
+    else:
+        response = await _get_with_retries(client, url)
+    _CACHE.put(
+        url,
+        response.headers.get('ETag'),
+        response.headers.get('Last-Modified'),
+        response.content,
+    )
+    return response.content
+
+def _parse_page(content: bytes, game_name: str, page_num: int):
+    """Parse one page of raw HTML into data columns plus a has-next flag.
+
+    Takes bytes and returns plain Python data so it can run in a worker
+    process: the CPU-heavy lxml work then runs truly in parallel with the
+    event loop's downloads instead of serializing behind the GIL.
+    """
+    months, avg_values, peak_values = [], [], []
+
+    # Single streaming pass picks up every candidate table plus the
+    # pagination links without building a full document tree
+    tables, pagination = _parse_page_elements(content)
+
+    # Pick the highest-priority candidate table
+    table = None
+    table_kind = None
+    if tables:
+        table_kind = min(tables, key=_TABLE_PRIORITY.__getitem__)
+        table = tables[table_kind]
+        log.debug("Found %s for %s", table_kind, game_name)
+
+    if table is None:
+        if page_num == 1:
+            log.warning("No suitable table found for %s", game_name)
+        else:
+            log.debug("No more pages found for %s", game_name)
+        return months, avg_values, peak_values, False
+
+    # Find header and map columns
+    header = table.find("thead")
+    if header is None:
+        log.warning("No header found in table for %s", game_name)
+        return months, avg_values, peak_values, False
+
+    header_cells = [_element_text(th).lower() for th in header.iter("th")]
+    if page_num == 1:
+        log.debug("Table columns: %s", header_cells)
+
+    # Find indices for average/daily and peak
+    avg_idx = None
+    peak_idx = None
+
+    # Classify each header in a single compiled-regex pass instead
+    # of a cascade of substring scans; first claim per column wins
+    for i, header_text in enumerate(header_cells):
+        match = HEADER_RE.search(header_text)
+        if not match:
+            continue
+        if match.lastgroup == "peak":
+            if peak_idx is None:
+                peak_idx = i
+        elif avg_idx is None:
+            avg_idx = i
+
+    # Special handling for asdrm-monthly-stats-table format (has "Estimated Players" but no peak)
+    if table_kind == "asdrm-monthly-stats-table":
+        if avg_idx is not None:
+            # For asdrm table, we'll use the "Estimated Players" for both avg and peak
+            # since there's no separate peak column
+            peak_idx = avg_idx
+            if page_num == 1:
+                log.debug("Using 'Estimated Players' column for both avg and peak (index %s)", avg_idx)
+
+    # Special handling for table_3 format (has "Average Daily Players" but no peak)
+    elif table_kind == "table_3":
+        if avg_idx is not None:
+            # For table_3, we'll use the "Average Daily Players" for both avg and peak
+            # since there's no separate peak column
+            peak_idx = avg_idx
+            if page_num == 1:
+                log.debug("Using 'Average Daily Players' column for both avg and peak (index %s)", avg_idx)
+
+    # Special handling for wgs-stats-table format (only has "Players" column)
+    elif table_kind == "wgs-stats-table":
+        if avg_idx is not None:
+            # Use the same column for both average and peak since there's no separate peak
+            peak_idx = avg_idx
+            if page_num == 1:
+                log.debug("Using single 'Players' column for both avg and peak (index %s)", avg_idx)
+
+    # Special handling for gst-data-table format (has "Daily Average Users" but no peak)
+    elif table_kind == "gst-data-table":
+        if avg_idx is not None:
+            # For gst table, we'll use the "Daily Average Users" for both avg and peak
+            # since there's no separate peak column
+            peak_idx = avg_idx
+            if page_num == 1:
+                log.debug("Using 'Daily Average Users' column for both avg and peak (index %s)", avg_idx)
+
+    # Special handling for table table-striped format (has "Daily Average" and "Peak Players")
+    elif table_kind == "table-striped":
+        if avg_idx is not None and peak_idx is not None:
+            if page_num == 1:
+                log.debug("Using 'Daily Average' (index %s) and 'Peak Players' (index %s) columns",
+                          avg_idx, peak_idx)
+        else:
+            log.warning("Could not find Daily Average and Peak Players columns "
+                        "for table-striped format, found: %s", header_cells)
+            return months, avg_values, peak_values, False
+
+    if avg_idx is None:
+        log.warning("Could not find an average/daily/players column for %s, found: %s",
+                    game_name, header_cells)
+        return months, avg_values, peak_values, False
+
+    if peak_idx is None:
+        log.warning("Could not find a peak/max player column for %s, found: %s",
+                    game_name, header_cells)
+        return months, avg_values, peak_values, False
+
+    if page_num == 1:
+        log.debug("Using columns: Avg Daily (index %s), Peak (index %s)", avg_idx, peak_idx)
+
+    # Collect ALL data rows from this page
+    for row in table.iter("tr"):
+        cols = _ROW_CELLS(row)
+        if len(cols) > max(avg_idx, peak_idx):
+            month = _element_text(cols[0])
+            avg_daily = parse_number_with_commas(_element_text(cols[avg_idx]))
+            peak = parse_number_with_commas(_element_text(cols[peak_idx]))
+
+            # Skip rows with invalid data (0 or empty values)
+            if avg_daily > 0 and peak > 0:
+                months.append(month)
+                avg_values.append(avg_daily)
+                peak_values.append(peak)
+
+    log.debug("Page %d: collected %d data points", page_num, len(months))
+
+    # A page with no new rows means we've walked off the end;
+    # don't bother looking for (or requesting) another page
+    if not months:
+        log.debug("No more pages found for %s", game_name)
+        return months, avg_values, peak_values, False
+
+    # Only continue when there is an explicit next link, matched on
+    # rel=next or the ms_page query instead of the link text
+    next_link = None
+    if pagination is not None:
+        for link in pagination.iter("a"):
+            href = link.get("href")
+            if href is None:
+                continue
+            if "next" in (link.get("rel") or "") or f"ms_page={page_num + 1}" in href:
+                next_link = link
+                break
+    if next_link is None:
+        log.debug("No more pages found for %s", game_name)
+        return months, avg_values, peak_values, False
+
+    return months, avg_values, peak_values, True
+
+async def scrape_activeplayer(client: httpx.AsyncClient, game_slug: str, game_name: str,
+                              semaphore: asyncio.Semaphore, parser_pool=None):
     url = f"https://activeplayer.io/{game_slug}/"
-    print(f"Scraping: {url}")
-    data = []
-    
-    # Create a robust session for this game
-    session = create_robust_session()
-    
-    # Track pages we've already scraped to avoid duplicates
-    scraped_pages = set()
+    log.debug("Scraping: %s", url)
+
+    # Four parallel columns instead of a list of row-lists, so the caller
+    # can hand pandas ready-made typed columns with no transpose step
+    months, games, avg_values, peak_values = [], [], [], []
+
+    loop = asyncio.get_running_loop()
     page_num = 1
-    
+
     while True:
         # Construct URL for current page
         if page_num == 1:
             current_url = url
         else:
             current_url = f"{url}?ms_page={page_num}"
-        
-        print(f"    📄 Scraping page {page_num}...")
-        
+
+        log.debug("Scraping page %d of %s...", page_num, game_name)
+
         try:
-            response = make_request_with_retry(session, current_url)
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Try different table structures in order of preference
-            table = None
-            
-            # 1. Try table_2 first (most common)
-            table = soup.find("table", id="table_2")
-            if table:
-                print(f"    📊 Found table_2 for {game_name}")
-            
-            # 2. Try table_3 as another option
-            if not table:
-                table = soup.find("table", id="table_3")
-                if table:
-                    print(f"    📊 Found table_3 for {game_name}")
-            
-            # 3. Try steam-stats-table as fallback
-            if not table:
-                table = soup.find("table", class_="steam-stats-table")
-                if table:
-                    print(f"    📊 Found steam-stats-table for {game_name}")
-            
-            # 4. Try asdrm-monthly-stats-table for mobile games
-            if not table:
-                table = soup.find("table", class_="asdrm-monthly-stats-table")
-                if table:
-                    print(f"    📊 Found asdrm-monthly-stats-table for {game_name}")
-            
-            # 5. Try gst-data-table for some games
-            if not table:
-                table = soup.find("table", class_="gst-data-table")
-                if table:
-                    print(f"    📊 Found gst-data-table for {game_name}")
-            
-            # 6. Try wgs-stats-table as another fallback
-            if not table:
-                table = soup.find("table", class_="wgs-stats-table")
-                if table:
-                    print(f"    📊 Found wgs-stats-table for {game_name}")
-            
-            # 7. Try table table-striped for games like Don't Starve Together
-            if not table:
-                table = soup.find("table", class_="table table-striped")
-                if table:
-                    print(f"    📊 Found table table-striped for {game_name}")
-            
-            if not table:
-                if page_num == 1:
-                    print(f"  ⚠️  No suitable table found for {game_name}")
-                else:
-                    print(f"    ✅ No more pages found for {game_name}")
-                break
-            
-            # Find header and map columns
-            header = table.find("thead")
-            if not header:
-                print(f"  ⚠️  No header found in table for {game_name}")
-                break
-            
-            header_cells = [th.get_text(strip=True).lower() for th in header.find_all("th")]
-            if page_num == 1:
-                print(f"    📋 Table columns: {header_cells}")
-            
-            # Find indices for average/daily and peak
-            avg_idx = None
-            peak_idx = None
-            
-            # Handle different column naming patterns
-            for i, header_text in enumerate(header_cells):
-                # For peak columns - check this FIRST to avoid conflicts
-                if any(keyword in header_text for keyword in ["peak", "max player", "max concurrent"]):
-                    peak_idx = i
-                # For average/daily columns - check this second
-                elif any(keyword in header_text for keyword in ["average daily", "daily avg", "daily average", "daily average users"]):
-                    avg_idx = i
-                # For estimated players (mobile games)
-                elif "estimated players" in header_text:
-                    avg_idx = i
-                # For monthly average users
-                elif "monthly average users" in header_text:
-                    avg_idx = i
-                # For wgs-stats-table format: "players" column (only if no peak found)
-                elif "players" in header_text and peak_idx is None:
-                    avg_idx = i
-                # For table_3 format: "average daily players" column
-                elif "average daily players" in header_text:
-                    avg_idx = i
-                # For table-striped format: "daily average" column
-                elif "daily average" in header_text:
-                    avg_idx = i
-            
-            # Special handling for asdrm-monthly-stats-table format (has "Estimated Players" but no peak)
-            if "asdrm-monthly-stats-table" in table.get("class", []):
-                if avg_idx is not None:
-                    # For asdrm table, we'll use the "Estimated Players" for both avg and peak
-                    # since there's no separate peak column
-                    peak_idx = avg_idx
-                    if page_num == 1:
-                        print(f"    📊 Using 'Estimated Players' column for both avg and peak (index {avg_idx})")
-            
-            # Special handling for table_3 format (has "Average Daily Players" but no peak)
-            elif table.get("id") == "table_3":
-                if avg_idx is not None:
-                    # For table_3, we'll use the "Average Daily Players" for both avg and peak
-                    # since there's no separate peak column
-                    peak_idx = avg_idx
-                    if page_num == 1:
-                        print(f"    📊 Using 'Average Daily Players' column for both avg and peak (index {avg_idx})")
-            
-            # Special handling for wgs-stats-table format (only has "Players" column)
-            elif "wgs-stats-table" in table.get("class", []):
-                if avg_idx is not None:
-                    # Use the same column for both average and peak since there's no separate peak
-                    peak_idx = avg_idx
-                    if page_num == 1:
-                        print(f"    📊 Using single 'Players' column for both avg and peak (index {avg_idx})")
-            
-            # Special handling for gst-data-table format (has "Daily Average Users" but no peak)
-            elif "gst-data-table" in table.get("class", []):
-                if avg_idx is not None:
-                    # For gst table, we'll use the "Daily Average Users" for both avg and peak
-                    # since there's no separate peak column
-                    peak_idx = avg_idx
-                    if page_num == 1:
-                        print(f"    📊 Using 'Daily Average Users' column for both avg and peak (index {avg_idx})")
-            
-            # Special handling for table table-striped format (has "Daily Average" and "Peak Players")
-            elif "table-striped" in table.get("class", []):
-                if avg_idx is not None and peak_idx is not None:
-                    if page_num == 1:
-                        print(f"    📊 Using 'Daily Average' (index {avg_idx}) and 'Peak Players' (index {peak_idx}) columns")
-                else:
-                    print(f"  ⚠️  Could not find required columns for table-striped format")
-                    print(f"    Expected: Daily Average and Peak Players columns")
-                    print(f"    Found: {header_cells}")
-                    break
-            
-            if avg_idx is None:
-                print(f"  ⚠️  Could not find required columns for {game_name}")
-                print(f"    Expected: average/daily/players column")
-                print(f"    Found: {header_cells}")
-                break
-            
-            if peak_idx is None:
-                print(f"  ⚠️  Could not find peak column for {game_name}")
-                print(f"    Expected: peak/max player/max concurrent column")
-                print(f"    Found: {header_cells}")
-                print(f"    Looking for keywords: peak, max player, max concurrent")
-                break
-            
-            if page_num == 1:
-                print(f"    📊 Using columns: Avg Daily (index {avg_idx}), Peak (index {peak_idx})")
-            
-            # Collect ALL data rows from this page
-            rows = table.find_all("tr")
-            page_data_count = 0
-            
-            for row in rows:
-                cols = row.find_all("td")
-                if len(cols) > max(avg_idx, peak_idx):
-                    month = cols[0].get_text(strip=True)
-                    avg_daily = parse_number_with_commas(cols[avg_idx].get_text(strip=True))
-                    peak = parse_number_with_commas(cols[peak_idx].get_text(strip=True))
-                    
-                    # Skip rows with invalid data (0 or empty values)
-                    if avg_daily > 0 and peak > 0:
-                        data.append([month, game_name, avg_daily, peak])
-                        page_data_count += 1
-            
-            print(f"    ✅ Page {page_num}: Collected {page_data_count} data points")
-            
-            # Check if there are more pages by looking for pagination links
-            pagination = soup.find("div", class_="ms-pagination")
-            if pagination:
-                next_links = pagination.find_all("a", href=True)
-                has_next = False
-                for link in next_links:
-                    if "Next" in link.get_text() or f"ms_page={page_num + 1}" in link.get("href", ""):
-                        has_next = True
-                        break
-                
-                if not has_next:
-                    print(f"    ✅ No more pages found for {game_name}")
-                    break
+            async with semaphore:
+                content = await fetch_with_cache(client, current_url)
+            # Hand the raw bytes to a parser process so this game's CPU
+            # work overlaps other games' downloads; fall back to a thread
+            # when no pool was provided
+            if parser_pool is not None:
+                page = await loop.run_in_executor(
+                    parser_pool, _parse_page, content, game_name, page_num)
             else:
-                # No pagination found, assume only one page
-                break
-            
-            page_num += 1
-            
-            # Small delay between pages to be respectful
-            if page_num > 1:
-                time.sleep(random.uniform(1, 3))
-            
+                page = await asyncio.to_thread(_parse_page, content, game_name, page_num)
         except Exception as e:
-            print(f"  ❌ Error scraping {game_name} page {page_num}: {e}")
+            log.error("Error scraping %s page %d: %s", game_name, page_num, e)
+            break
+
+        page_months, page_avg, page_peak, has_next = page
+        months.extend(page_months)
+        games.extend([game_name] * len(page_months))
+        avg_values.extend(page_avg)
+        peak_values.extend(page_peak)
+
+        if not has_next:
             break
-    
-    # Close the session
-    session.close()
-    
-    if data:
-        print(f"    ✅ {game_name}: Collected {len(data)} total monthly data points")
+        page_num += 1
+
+    if months:
+        log.info("%s: collected %d total monthly data points", game_name, len(months))
     else:
-        print(f"    ⚠️  No valid data rows found for {game_name}")
-    
-    return data
+        log.warning("No valid data rows found for %s", game_name)
+
+    return months, games, avg_values, peak_values
+
+async def _scrape_and_store(client, game_slug, game_name, semaphore, parser_pool, output_file):
+    """Scrape one game and write its partition as soon as it finishes.
+
+    Keeps memory bounded to a single game's rows and leaves partial
+    progress on disk if a later game crashes the run.
+    """
+    months, games, avg_values, peak_values = await scrape_activeplayer(
+        client, game_slug, game_name, semaphore, parser_pool)
+    if not months:
+        return 0, 0.0
+
+    # Columnar construction with explicit dtypes: no AoS->SoA transpose
+    # inside pandas, and float32 halves the numeric memory
+    df = pd.DataFrame({
+        "Month": months,
+        "Game": games,
+        "Avg Players": np.asarray(avg_values, dtype=np.float32),
+        "Peak Players": np.asarray(peak_values, dtype=np.float32),
+    })
+    # delete_matching replaces this game's partition from earlier runs
+    # instead of appending duplicate row groups
+    await asyncio.to_thread(
+        df.to_parquet,
+        output_file,
+        engine='pyarrow',
+        compression='zstd',
+        partition_cols=['Game'],
+        existing_data_behavior='delete_matching',
+    )
+    return len(months), max(peak_values)
+
+async def _scrape_all_games(activeplayer_games, output_file):
+    """Scrape every game concurrently over one HTTP/2 client.
+
+    Fetches run on the event loop while pages parse in a pool of worker
+    processes, pipelining downloads with the CPU-bound lxml work.
+    """
+    semaphore = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+    # Spawn rather than fork: the scrapers run on threads under
+    # combine_data, and forking a multithreaded process can clone a
+    # held lock into the child and deadlock it
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as parser_pool:
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=25,
+            headers=BROWSER_HEADERS,
+            transport=httpx.AsyncHTTPTransport(retries=3, http2=True, limits=_LIMITS),
+        ) as client:
+            tasks = [
+                _scrape_and_store(client, slug, game, semaphore, parser_pool, output_file)
+                for game, slug in activeplayer_games.items()
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
 
 def scrape_activeplayer_games():
     activeplayer_games = get_activeplayer_games()
-    all_data = []
-    for i, (game, slug) in enumerate(activeplayer_games.items(), 1):
-        print(f"[{i}/{len(activeplayer_games)}] Scraping {game}...")
-        game_data = scrape_activeplayer(slug, game)
-        if game_data:
-            all_data.extend(game_data)
-        if i < len(activeplayer_games):
-            # Removed random_delay()
-            pass
-    if all_data:
-        df = pd.DataFrame(all_data, columns=["Month", "Game", "Avg Players", "Peak Players"])
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
-        output_file = os.path.join(OUTPUT_DIR, ACTIVEPLAYER_OUTPUT_FILE)
-        df.to_csv(output_file, index=False)
-        print(f"\n✅ Data saved to {output_file}")
-        print(f"📊 Total records: {len(df)}")
-        print(f"🎮 Games scraped: {df['Game'].nunique()}")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Partitioned Parquet: typed columnar storage, ~5x smaller than CSV
+    # and far faster to read back, with per-game predicate pushdown
+    output_file = os.path.join(OUTPUT_DIR, ACTIVEPLAYER_PARQUET_DIR)
+
+    log.info("🚀 Scraping %d games over one HTTP/2 connection...", len(activeplayer_games))
+    results = asyncio.run(_scrape_all_games(activeplayer_games, output_file))
+
+    # Running O(1)-memory summary instead of holding every row until the end
+    total_records = 0
+    peak_by_game = {}
+    for i, (game, result) in enumerate(zip(activeplayer_games, results), 1):
+        if isinstance(result, BaseException):
+            log.error("%s failed: %s", game, result)
+            continue
+        record_count, max_peak = result
+        if record_count:
+            log.info("[%d/%d] Finished %s", i, len(activeplayer_games), game)
+            total_records += record_count
+            peak_by_game[game] = max_peak
+
+    if total_records:
+        log.info("✅ Data saved to %s", output_file)
+        log.info("📊 Total records: %d", total_records)
+        log.info("🎮 Games scraped: %d", len(peak_by_game))
+        # Read back only this run's partitions - the dataset may still
+        # hold games that failed this run or left the config
+        return pd.read_parquet(
+            output_file, filters=[('Game', 'in', list(peak_by_game))])
     else:
-        print("\n❌ No data was scraped successfully")
+        log.error("❌ No data was scraped successfully")
+        return pd.DataFrame()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     scrape_activeplayer_games() 
\ No newline at end of file
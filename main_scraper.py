@@ -1,5 +1,5 @@
 import pandas as pd
-import time
+import concurrent.futures
 import os
 from datetime import datetime
 from steamdb_scraper import scrape_steam_games
@@ -18,48 +18,55 @@ def combine_data():
     print(f"📅 Started at: {timestamp}")
     
     all_data = []
-    
-    # Scrape Steam games
-    print("\n🔥 Starting Steam Charts scraper...")
-    try:
-        steam_df = scrape_steam_games()
-        if not steam_df.empty:
-            # Add source column
-            steam_df['Source'] = 'Steam Charts'
-            steam_df['Scraped At'] = timestamp
-            all_data.append(steam_df)
-            print(f"✅ Steam data: {len(steam_df)} records")
-        else:
-            print("❌ No Steam data collected")
-    except Exception as e:
-        print(f"❌ Steam scraper failed: {e}")
-    
-    # Wait between scrapers
-    print("\n⏳ Waiting 30 seconds before starting ActivePlayer scraper...")
-    time.sleep(30)
-    
-    # Scrape ActivePlayer games
-    print("\n🌐 Starting ActivePlayer scraper...")
-    try:
-        activeplayer_df = scrape_activeplayer_games()
-        if not activeplayer_df.empty:
-            # Add source column
-            activeplayer_df['Source'] = 'ActivePlayer'
-            activeplayer_df['Scraped At'] = timestamp
-            all_data.append(activeplayer_df)
-            print(f"✅ ActivePlayer data: {len(activeplayer_df)} records")
-        else:
-            print("❌ No ActivePlayer data collected")
-    except Exception as e:
-        print(f"❌ ActivePlayer scraper failed: {e}")
-    
+
+    # Run both scrapers concurrently - they hit different domains with
+    # independent rate limits, so total wall time is max(steam, activeplayer)
+    # instead of steam + 30s pause + activeplayer
+    print("\n🔥 Starting Steam Charts and ActivePlayer scrapers...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        steam_future = executor.submit(scrape_steam_games)
+        activeplayer_future = executor.submit(scrape_activeplayer_games)
+
+        try:
+            steam_df = steam_future.result()
+        except Exception as e:
+            print(f"❌ Steam scraper failed: {e}")
+            steam_df = pd.DataFrame()
+
+        try:
+            activeplayer_df = activeplayer_future.result()
+        except Exception as e:
+            print(f"❌ ActivePlayer scraper failed: {e}")
+            activeplayer_df = pd.DataFrame()
+
+    if not steam_df.empty:
+        # Add source column
+        steam_df['Source'] = 'Steam Charts'
+        steam_df['Scraped At'] = timestamp
+        all_data.append(steam_df)
+        print(f"✅ Steam data: {len(steam_df)} records")
+    else:
+        print("❌ No Steam data collected")
+
+    if not activeplayer_df.empty:
+        # Add source column
+        activeplayer_df['Source'] = 'ActivePlayer'
+        activeplayer_df['Scraped At'] = timestamp
+        all_data.append(activeplayer_df)
+        print(f"✅ ActivePlayer data: {len(activeplayer_df)} records")
+    else:
+        print("❌ No ActivePlayer data collected")
+
     # Combine all data
     if all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
         
-        # Save combined data to data/ directory
+        # Save combined data to data/ directory. A 1 MiB buffer and a
+        # fixed line terminator mean a few large write() syscalls rather
+        # than pandas' default small-buffer handle and newline sniffing
         output_file = os.path.join("data", "combined_player_counts.csv")
-        combined_df.to_csv(output_file, index=False)
+        with open(output_file, "w", buffering=1 << 20, newline='', encoding='utf-8') as f:
+            combined_df.to_csv(f, index=False, lineterminator='\n')
         print(f"\n✅ Combined data saved: {len(combined_df)} total records")
         print(f"📁 File: {output_file}")
         
@@ -69,24 +76,24 @@ def combine_data():
         print(f"Unique games: {combined_df['Game'].nunique()}")
         print(f"Sources: {combined_df['Source'].unique()}")
         
-        # Show top games by average players (Steam data)
+        # Show top games per source: one grouped max serves both
+        # printouts, so the (Source, Game) hash table is built once;
+        # sort=False skips groupby's implicit group sort
         if 'Avg Players' in combined_df.columns:
-            steam_only = combined_df[combined_df['Source'] == 'Steam Charts']
-            if not steam_only.empty:
-                print("\n🏆 Top Steam Games (by Average Players):")
-                top_steam = steam_only.groupby('Game')['Avg Players'].max().sort_values(ascending=False).head(10)
-                for i, (game, players) in enumerate(top_steam.items(), 1):
-                    print(f"  {i:2d}. {game}: {players:,.0f}")
-        
-        # Show top games by current players (ActivePlayer data)
-        if 'Current Players' in combined_df.columns:
-            activeplayer_only = combined_df[combined_df['Source'] == 'ActivePlayer']
-            if not activeplayer_only.empty:
-                print("\n🏆 Top ActivePlayer Games (by Current Players):")
-                top_activeplayer = activeplayer_only.groupby('Game')['Current Players'].max().sort_values(ascending=False).head(10)
-                for i, (game, players) in enumerate(top_activeplayer.items(), 1):
+            tops = (combined_df.groupby(['Source', 'Game'], sort=False)['Avg Players']
+                    .max().reset_index())
+            for source, title in [
+                ('Steam Charts', 'Top Steam Games (by Average Players)'),
+                ('ActivePlayer', 'Top ActivePlayer Games (by Average Players)'),
+            ]:
+                top_games = tops[tops['Source'] == source].nlargest(10, 'Avg Players')
+                if top_games.empty:
+                    continue
+                print(f"\n🏆 {title}:")
+                for i, (game, players) in enumerate(
+                        zip(top_games['Game'], top_games['Avg Players']), 1):
                     print(f"  {i:2d}. {game}: {players:,.0f}")
-        
+
         return combined_df
     else:
         print("\n❌ No data was collected from any source")
@@ -106,8 +113,12 @@ def run_activeplayer_only():
 
 
 if __name__ == "__main__":
+    import logging
     import sys
-    
+
+    # Keep the scrapers' info-level progress visible when run from here
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if len(sys.argv) > 1:
         mode = sys.argv[1].lower()
         if mode == "steam":
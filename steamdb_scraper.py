@@ -1,8 +1,15 @@
 import pandas as pd
+import asyncio
+import atexit
+import httpx
+import logging
+import multiprocessing
+import threading
 import time
 import random
 import os
 from typing import List
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -12,8 +19,11 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException
 import re
+from datetime import datetime
 from config import get_steam_games, get_scraping_config, get_browser_config
 
+log = logging.getLogger(__name__)
+
 # Get configuration from environment
 scraping_config = get_scraping_config()
 browser_config = get_browser_config()
@@ -24,8 +34,63 @@ REQUEST_DELAY_MAX = scraping_config['REQUEST_DELAY_MAX']
 PAGE_LOAD_TIMEOUT = scraping_config['PAGE_LOAD_TIMEOUT']
 MAX_RETRIES = scraping_config['MAX_RETRIES']
 
-# Get games from configuration
-steam_games = {game: int(app_id) for game, app_id in get_steam_games().items()}
+# Games frozen to a tuple at import time: iteration is a pure pointer
+# walk, the order is fixed for zipping against gather results, and the
+# list pickles cheaply if it ever crosses a process boundary
+STEAM_GAMES = tuple((game, int(app_id)) for game, app_id in get_steam_games().items())
+
+# Cap concurrent in-flight requests against steamcharts.com to stay polite
+MAX_INFLIGHT_REQUESTS = 4
+
+# Parallel Chrome workers for the Selenium fallback; browser I/O, not
+# CPU, is the critical path there, so a few drivers overlap nicely
+MAX_FALLBACK_WORKERS = 3
+
+# Rows of the monthly stats table, regardless of where the table sits
+_TABLE_ROWS_XPATH = "//table[contains(@class,'common-table')]//tr"
+
+# Per-game scrape cache; historical monthly rows only change once a
+# month, so a frame written this calendar month is still current
+CACHE_DIR = os.path.join("data", "cache")
+
+# Where the resolved ChromeDriver path is remembered between runs
+_CHROMEDRIVER_CACHE = os.path.join(
+    os.path.expanduser("~"), ".cache", "games_scraper", "chromedriver_path")
+
+_chromedriver_path = None
+
+
+def _get_chromedriver_path() -> str:
+    """Resolve the ChromeDriver binary without re-downloading it per run.
+
+    Checks CHROMEDRIVER_PATH, then the on-disk cache, and only falls
+    back to ChromeDriverManager().install() (network fetch + unzip) on a
+    cold cache - saving seconds of startup and working offline.
+    """
+    global _chromedriver_path
+    if _chromedriver_path:
+        return _chromedriver_path
+
+    path = os.environ.get("CHROMEDRIVER_PATH")
+    if not (path and os.path.exists(path)):
+        path = None
+        try:
+            with open(_CHROMEDRIVER_CACHE) as f:
+                cached = f.read().strip()
+            if os.path.exists(cached):
+                path = cached
+        except OSError:
+            pass
+
+    if path is None:
+        log.info("Downloading ChromeDriver (first run)...")
+        path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(_CHROMEDRIVER_CACHE), exist_ok=True)
+        with open(_CHROMEDRIVER_CACHE, "w") as f:
+            f.write(path)
+
+    _chromedriver_path = path
+    return path
 
 
 def setup_driver() -> webdriver.Chrome:
@@ -45,11 +110,19 @@ def setup_driver() -> webdriver.Chrome:
     
     # Set user agent from configuration
     chrome_options.add_argument(f"--user-agent={browser_config['USER_AGENT']}")
-    
-    # Remove CSS/JS disabling as it might cause issues
-    # chrome_options.add_argument("--disable-images")
-    # chrome_options.add_argument("--disable-css")
-    
+
+    # Block images/CSS/fonts - we only need the HTML table, so skip the
+    # render pipeline bytes entirely
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.stylesheets": 2,
+        "profile.default_content_setting_values.fonts": 2,
+    })
+
+    # Return from driver.get() at DOMContentLoaded instead of waiting for
+    # every tracker/ad to finish loading
+    chrome_options.page_load_strategy = "eager"
+
     # Set window size from configuration
     chrome_options.add_argument(f"--window-size={browser_config['WINDOW_SIZE']}")
     
@@ -71,7 +144,7 @@ def setup_driver() -> webdriver.Chrome:
     chrome_options.add_argument("--disable-ipc-flooding-protection")
     
     # Initialize driver
-    service = Service(ChromeDriverManager().install())
+    service = Service(_get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     
     # Execute script to remove webdriver property
@@ -79,236 +152,481 @@ def setup_driver() -> webdriver.Chrome:
     
     # Set page load timeout
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-    
+
+    # No implicit wait - it would compound with the explicit WebDriverWaits
+    driver.implicitly_wait(0)
+
     return driver
 
 
-def parse_number_with_commas(text: str) -> float:
-    """Parse a number that may contain commas and percentage signs."""
-    if not text or text.strip() == '':
-        return 0.0
-    
-    # Remove commas and any percentage signs
-    cleaned = text.replace(',', '').replace('%', '').strip()
-    
-    # Handle percentage changes (like +872.4, -17128.7)
-    if cleaned.startswith('+') or cleaned.startswith('-'):
-        # This is a percentage change, not an absolute number
-        return 0.0
-    
+def _load_cached_game(app_id: int) -> pd.DataFrame:
+    """Return a game's cached frame if it was written this calendar month."""
+    path = os.path.join(CACHE_DIR, f"{app_id}.parquet")
+    try:
+        mtime = datetime.fromtimestamp(os.path.getmtime(path))
+    except OSError:
+        return None
+    now = datetime.now()
+    if (mtime.year, mtime.month) != (now.year, now.month):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        log.warning("Discarding unreadable cache for app %s: %s", app_id, e)
+        return None
+
+
+def _store_cached_game(app_id: int, df: pd.DataFrame) -> None:
+    """Write a game's freshly scraped frame to the monthly cache."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    df.to_parquet(os.path.join(CACHE_DIR, f"{app_id}.parquet"),
+                  engine='pyarrow', compression='zstd')
+
+
+# Selector that found the table last time; tried first (with a short
+# wait) on later pages since the winner is almost always the same
+_LAST_GOOD_SELECTOR = None
+
+
+def _wait_for_table(driver: webdriver.Chrome):
+    """Wait for the stats table, remembering which selector worked.
+
+    The cached selector gets a cheap 5-second try before falling back to
+    one combined 15-second wait across every known selector.
+    """
+    global _LAST_GOOD_SELECTOR
+
+    table_selectors = [
+        "table.common-table",
+        "table",
+        ".common-table",
+        "#app-charts table",
+        ".app-charts table"
+    ]
+
+    if _LAST_GOOD_SELECTOR:
+        try:
+            return WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _LAST_GOOD_SELECTOR)))
+        except TimeoutException:
+            pass
+
+    try:
+        WebDriverWait(driver, 15).until(EC.any_of(*[
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            for selector in table_selectors
+        ]))
+    except TimeoutException:
+        return None
+
+    # Work out which selector actually matched so the next page can
+    # start (and succeed) with it alone
+    for selector in table_selectors:
+        found = driver.find_elements(By.CSS_SELECTOR, selector)
+        if found:
+            _LAST_GOOD_SELECTOR = selector
+            return found[0]
+    return None
+
+
+def _detect_player_columns(header_texts: List[str]):
+    """Map header texts to (avg, peak) column indices.
+
+    Steam Charts typically has: Month, Avg. Players, Gain, % Gain, Peak
+    Players - but the order has changed before, so match on the header
+    text and only fall back to the common positions.
+    """
+    avg_col_idx = None
+    peak_col_idx = None
+    if len(header_texts) >= 3:
+        for i, header_text in enumerate(header_texts):
+            header_text = header_text.strip().lower()
+            if 'avg' in header_text and 'player' in header_text:
+                avg_col_idx = i
+            elif 'peak' in header_text and 'player' in header_text:
+                peak_col_idx = i
+
+        # If we couldn't find the specific columns, try common positions
+        if avg_col_idx is None and len(header_texts) >= 2:
+            avg_col_idx = 1  # Usually second column
+        if peak_col_idx is None and len(header_texts) >= 3:
+            peak_col_idx = 2  # Usually third column
+    return avg_col_idx, peak_col_idx
+
+
+# Column indices detected from the first successfully parsed header;
+# the table schema is fixed across games, so later pages skip header
+# parsing entirely. The lock matters once scrapers run from threads.
+_COL_IDX = {'avg': None, 'peak': None}
+_COL_IDX_LOCK = threading.Lock()
+
+
+def _parse_stats_tree(tree) -> List[tuple]:
+    """Extract (month, avg_raw, peak_raw) tuples from a parsed page.
+
+    Player counts stay raw strings here; scrape_steam_games converts the
+    whole column in one vectorized pandas pass instead of calling a
+    Python parser once per cell.
+    """
+    rows_buf = []
+
+    rows = tree.xpath(_TABLE_ROWS_XPATH)
+    if not rows:
+        return rows_buf
+    log.debug("Found %d rows in table", len(rows))
+
+    avg_col_idx = _COL_IDX['avg']
+    peak_col_idx = _COL_IDX['peak']
+    if avg_col_idx is None or peak_col_idx is None:
+        header_cells = rows[0].xpath(".//th") or rows[0].xpath(".//td")
+        header_texts = [cell.text_content() for cell in header_cells]
+        log.debug("Table headers: %s", header_texts)
+
+        avg_col_idx, peak_col_idx = _detect_player_columns(header_texts)
+        if avg_col_idx is not None and peak_col_idx is not None:
+            with _COL_IDX_LOCK:
+                _COL_IDX['avg'] = avg_col_idx
+                _COL_IDX['peak'] = peak_col_idx
+    log.debug("Using columns: Avg=%s, Peak=%s", avg_col_idx, peak_col_idx)
+
+    for row in rows[1:]:
+        cols = [cell.text_content().strip() for cell in row.xpath(".//td")]
+        if len(cols) >= 3:
+            month = cols[0]
+            avg_players = cols[avg_col_idx] if avg_col_idx is not None else "0"
+            peak_players = cols[peak_col_idx] if peak_col_idx is not None else "0"
+            rows_buf.append((month, avg_players, peak_players))
+
+    return rows_buf
+
+
+def _records_to_frame(rows_buf: List[tuple], game_name: str) -> pd.DataFrame:
+    """Build one game's raw-string frame from its row tuples."""
+    return pd.DataFrame.from_records(
+        rows_buf, columns=['Month', 'AvgRaw', 'PeakRaw']).assign(Game=game_name)
+
+
+def _write_counts_csv(df: pd.DataFrame, output_file: str) -> None:
+    """Stringify and write the counts CSV in one buffered pass.
+
+    pandas' general-purpose CSV writer is an order of magnitude slower
+    than a format-string loop for this fixed four-column layout. Only
+    the Game column can contain a comma, so full csv-module quoting is
+    skipped and those names are quoted by hand.
+    """
+    with open(output_file, "w", buffering=1 << 20, encoding="utf-8") as f:
+        f.write("Month,Game,Avg Players,Peak Players\n")
+        rows = zip(df["Month"], df["Game"], df["Avg Players"], df["Peak Players"])
+        lines = ("%s,%s,%.0f,%.0f" % (month, '"%s"' % game if "," in game else game, avg, peak)
+                 for month, game, avg, peak in rows)
+        f.write("\n".join(lines))
+        f.write("\n")
+
+
+def _parse_count_column(raw: pd.Series) -> pd.Series:
+    """Vectorized equivalent of utils.parse_number_with_commas.
+
+    Strips separators and percent signs, zeroes out signed gain values,
+    and coerces anything non-numeric to 0.0 - all in C loops rather than
+    a Python call per cell.
+    """
+    cleaned = raw.str.replace(r'[,%]', '', regex=True)
+    cleaned = cleaned.where(~raw.str.match(r'\s*[+-]'), '0')
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0.0)
+
+
+async def scrape_steamcharts(client: httpx.AsyncClient, app_id: int, game_name: str) -> pd.DataFrame:
+    """Scrape Steam Charts data for a given game over plain HTTP.
+
+    steamcharts.com renders the monthly table server-side, so a browser
+    is unnecessary on the happy path: one GET plus an in-process lxml
+    parse replaces the Chrome navigate/render/RPC cycle.
+
+    Args:
+        client: Shared httpx.AsyncClient
+        app_id: Steam App ID for the game
+        game_name: Name of the game
+
+    Returns:
+        DataFrame of raw-string Month/AvgRaw/PeakRaw/Game rows
+    """
+    url = f"https://steamcharts.com/app/{app_id}"
+
     try:
-        return float(cleaned)
-    except ValueError:
-        return 0.0
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        log.warning("HTTP fetch failed for %s: %s", game_name, e)
+        return pd.DataFrame()
 
+    rows_buf = _parse_stats_tree(lxml_html.fromstring(response.text))
+    if not rows_buf:
+        log.warning("No common-table rows found for %s over HTTP", game_name)
+        return pd.DataFrame()
 
-def scrape_steamcharts(driver: webdriver.Chrome, app_id: int, game_name: str) -> List[List]:
+    log.info("Successfully scraped %d records for %s", len(rows_buf), game_name)
+    return _records_to_frame(rows_buf, game_name)
+
+
+async def _scrape_all_steam_games(games: tuple) -> List:
+    """Scrape every game concurrently over one keep-alive HTTP client."""
+    semaphore = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+
+    async def bounded_scrape(app_id: int, game_name: str):
+        # Spread out request starts so the burst stays under the radar
+        await asyncio.sleep(random.uniform(0, REQUEST_DELAY_MIN))
+        async with semaphore:
+            return await scrape_steamcharts(client, app_id, game_name)
+
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": browser_config['USER_AGENT']},
+        timeout=PAGE_LOAD_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(retries=MAX_RETRIES, http2=True),
+    ) as client:
+        tasks = [bounded_scrape(app_id, game) for game, app_id in games]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def scrape_steamcharts_selenium(driver: webdriver.Chrome, app_id: int, game_name: str) -> List[List]:
     """Scrape Steam Charts data for a given game using Selenium.
-    
+
+    Fallback for pages the plain-HTTP path could not parse (e.g. a
+    Cloudflare interstitial); a real browser clears the check.
+
     Args:
         driver: Chrome WebDriver instance
         app_id: Steam App ID for the game
         game_name: Name of the game
-        
+
     Returns:
-        List of lists containing [month, game_name, avg_players, peak_players]
+        DataFrame of raw-string Month/AvgRaw/PeakRaw/Game rows
     """
     url = f"https://steamcharts.com/app/{app_id}#All"
-    data = []
-    
+    rows_buf = []
+
     for attempt in range(MAX_RETRIES):
         try:
-            print(f"  Loading {game_name} page... (attempt {attempt + 1}/{MAX_RETRIES})")
+            log.debug("Loading %s page... (attempt %d/%d)", game_name, attempt + 1, MAX_RETRIES)
             driver.get(url)
-            
-            # Wait a bit for page to load
-            time.sleep(8)  # Increased wait time
-            
-            # Try different table selectors
-            table_selectors = [
-                "table.common-table",
-                "table",
-                ".common-table",
-                "#app-charts table",
-                ".app-charts table"
-            ]
-            
-            table = None
-            for selector in table_selectors:
-                try:
-                    wait = WebDriverWait(driver, 15)  # Increased timeout
-                    table = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    print(f"    Found table with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not table:
-                print(f"    ❌ No table found. Page title: {driver.title}")
+
+            # Wait on a real condition instead of a fixed sleep, trying
+            # the selector that worked last time first
+            table = _wait_for_table(driver)
+
+            if table is None:
+                log.warning("No table found for %s. Page title: %s", game_name, driver.title)
                 if attempt < MAX_RETRIES - 1:
-                    print(f"    🔄 Retrying in 10 seconds...")
-                    time.sleep(10)
-                    continue
-                return []
-            
-            # Find all rows in the table
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            print(f"    📋 Found {len(rows)} rows in table")
-            
-            # First, let's examine the header to understand the column structure
-            if rows:
-                header_row = rows[0]
-                header_cells = header_row.find_elements(By.TAG_NAME, "th")
-                if not header_cells:
-                    header_cells = header_row.find_elements(By.TAG_NAME, "td")
-                
-                print(f"    📊 Table headers: {[cell.text.strip() for cell in header_cells]}")
-            
-            # Look for the correct columns - we need to find columns with actual player counts
-            # Steam Charts typically has: Month, Avg. Players, Peak Players, Gain, % Gain
-            avg_col_idx = None
-            peak_col_idx = None
-            
-            if len(header_cells) >= 3:
-                for i, header in enumerate(header_cells):
-                    header_text = header.text.strip().lower()
-                    if 'avg' in header_text and 'player' in header_text:
-                        avg_col_idx = i
-                    elif 'peak' in header_text and 'player' in header_text:
-                        peak_col_idx = i
-                
-                # If we couldn't find the specific columns, try common positions
-                if avg_col_idx is None and len(header_cells) >= 2:
-                    avg_col_idx = 1  # Usually second column
-                if peak_col_idx is None and len(header_cells) >= 3:
-                    peak_col_idx = 2  # Usually third column
-            
-            print(f"    🎯 Using columns: Avg={avg_col_idx}, Peak={peak_col_idx}")
-            
-            # Skip header row and process data rows
-            for i, row in enumerate(rows[1:], 1):
-                try:
-                    cols = row.find_elements(By.TAG_NAME, "td")
-                    if len(cols) >= 3:
-                        month = cols[0].text.strip()
-                        
-                        # Get player counts from the identified columns
-                        avg_players = cols[avg_col_idx].text.strip() if avg_col_idx is not None else "0"
-                        peak_players = cols[peak_col_idx].text.strip() if peak_col_idx is not None else "0"
-                        
-                        # Debug: Print raw values for first few rows
-                        if i <= 3:
-                            print(f"      Row {i}: Month='{month}', Avg='{avg_players}', Peak='{peak_players}'")
-                        
-                        # Parse the numbers
-                        avg_players_num = parse_number_with_commas(avg_players)
-                        peak_players_num = parse_number_with_commas(peak_players)
-                        
-                        # Only add if we have valid numbers
-                        if avg_players_num > 0 or peak_players_num > 0:
-                            data.append([month, game_name, avg_players_num, peak_players_num])
-                        elif i <= 5:  # Debug info for first few rows
-                            print(f"      ⚠️  Skipping row {i} - no valid player counts")
-                            
-                except Exception as e:
-                    print(f"    Error processing row {i} for {game_name}: {e}")
+                    delay = _backoff_delay(attempt)
+                    log.debug("Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
                     continue
-            
+                return pd.DataFrame()
+
+            # The table is all we need - stop the page so leftover
+            # trackers/ads never load under the eager strategy
+            driver.execute_script("window.stop();")
+
+            # One page_source grab and an in-process lxml parse instead
+            # of a DevTools round-trip per cell (~4N RPCs for N rows)
+            rows_buf = _parse_stats_tree(lxml_html.fromstring(driver.page_source))
+
             # If we got here successfully, break out of retry loop
             break
                     
         except TimeoutException:
-            print(f"  ⚠️  Timeout loading {game_name} page (attempt {attempt + 1})")
+            log.warning("Timeout loading %s page (attempt %d)", game_name, attempt + 1)
             if attempt < MAX_RETRIES - 1:
-                print(f"  🔄 Retrying in 15 seconds...")
-                time.sleep(15)
+                # Timeouts usually mean the site is struggling - back off
+                # twice as hard as for other failures
+                delay = _backoff_delay(attempt, base=2.0)
+                log.debug("Retrying in %.1f seconds...", delay)
+                time.sleep(delay)
             else:
-                print(f"  ❌ Failed to load {game_name} after {MAX_RETRIES} attempts")
-                return []
+                log.error("Failed to load %s after %d attempts", game_name, MAX_RETRIES)
+                return pd.DataFrame()
         except Exception as e:
-            print(f"  ❌ Error scraping {game_name} (attempt {attempt + 1}): {e}")
+            log.error("Error scraping %s (attempt %d): %s", game_name, attempt + 1, e)
             if attempt < MAX_RETRIES - 1:
-                print(f"  🔄 Retrying in 10 seconds...")
-                time.sleep(10)
+                delay = _backoff_delay(attempt)
+                log.debug("Retrying in %.1f seconds...", delay)
+                time.sleep(delay)
             else:
-                return []
-    
-    print(f"  ✅ Successfully scraped {len(data)} records for {game_name}")
-    return data
+                return pd.DataFrame()
+
+    log.info("Successfully scraped %d records for %s", len(rows_buf), game_name)
+    return _records_to_frame(rows_buf, game_name)
+
+
+def _backoff_delay(attempt: int, base: float = 1.0) -> float:
+    """Exponential backoff with jitter, capped at 60 seconds.
+
+    Transient faults recover after a short pause instead of a fixed
+    10-15s, while repeated failures back off progressively harder.
+    """
+    return min(60.0, base * (2 ** attempt) + random.uniform(0, 1))
 
 
 def random_delay() -> None:
     """Add random delay between requests to avoid detection."""
     delay = random.uniform(REQUEST_DELAY_MIN, REQUEST_DELAY_MAX)
-    print(f"  Waiting {delay:.1f} seconds...")
+    log.debug("Waiting %.1f seconds...", delay)
     time.sleep(delay)
 
 
+_WORKER_DRIVER = None
+
+
+def _init_fallback_driver() -> None:
+    """Start one Chrome per worker process and keep it for its lifetime.
+
+    Pre-warms the site so each worker passes any bot interstitial once
+    and reuses its HTTP/2 connection for every /app/{id} navigation.
+
+    Must never raise: Pool would respawn a failing initializer forever
+    and hang imap_unordered instead of surfacing the error, so failure
+    is recorded as a missing driver and the workers bail per task.
+    """
+    global _WORKER_DRIVER
+    driver = None
+    try:
+        driver = setup_driver()
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.get("https://steamcharts.com/")
+        time.sleep(2)
+    except Exception as e:
+        log.error("Chrome worker failed to start: %s", e)
+        if driver is not None:
+            driver.quit()
+        _WORKER_DRIVER = None
+        return
+    _WORKER_DRIVER = driver
+    atexit.register(driver.quit)
+
+
+def _fallback_worker(task):
+    """Scrape one game on this worker's Chrome, staying polite per driver."""
+    game, app_id = task
+    if _WORKER_DRIVER is None:
+        log.error("Skipping %s: this worker has no Chrome", game)
+        return game, app_id, pd.DataFrame()
+    log.info("Scraping %s with Selenium...", game)
+    game_data = scrape_steamcharts_selenium(_WORKER_DRIVER, app_id, game)
+    random_delay()
+    return game, app_id, game_data
+
+
+def _scrape_fallback_games(fallback_games: dict, all_dfs: List[pd.DataFrame]) -> int:
+    """Run the Selenium scraper over games the HTTP path came up empty on.
+
+    Returns the number of games that yielded data. Browsers only start
+    here, so a fully successful HTTP pass never pays for Chrome; each
+    pool worker owns one driver, parallelizing the browser-bound wait.
+    """
+    successful_games = 0
+    workers = min(MAX_FALLBACK_WORKERS, len(fallback_games))
+    try:
+        # Resolve ChromeDriver up front so workers don't race to download it
+        _get_chromedriver_path()
+        log.info("📱 Starting %d Chrome worker(s) for %d fallback games...",
+                 workers, len(fallback_games))
+        # Spawn rather than fork: the scrapers run on threads under
+        # combine_data, and forking a multithreaded process can clone a
+        # held lock into the child and deadlock it
+        pool = multiprocessing.get_context("spawn").Pool(
+            processes=workers, initializer=_init_fallback_driver)
+        try:
+            tasks = list(fallback_games.items())
+            for game, app_id, game_data in pool.imap_unordered(_fallback_worker, tasks, chunksize=1):
+                if not game_data.empty:
+                    all_dfs.append(game_data)
+                    _store_cached_game(app_id, game_data)
+                    successful_games += 1
+        finally:
+            # close + join (not terminate) so workers exit normally and
+            # their atexit driver.quit handlers actually run
+            pool.close()
+            pool.join()
+    except Exception as e:
+        log.error("💥 Selenium fallback failed: %s", e)
+    return successful_games
+
+
 def scrape_steam_games() -> pd.DataFrame:
     """Main function to scrape all Steam games and return DataFrame."""
-    print("🚀 Starting Steam Charts scraper with Selenium...")
-    
+    log.info("🚀 Starting Steam Charts scraper...")
+
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
-    
-    driver = None
+
+    total_games = len(STEAM_GAMES)
+
+    # Serve games scraped earlier this month from the cache; the
+    # monthly table won't have changed, so only the rest hit the site
+    all_dfs = []
+    successful_games = 0
+    to_scrape = []
+    for game, app_id in STEAM_GAMES:
+        cached = _load_cached_game(app_id)
+        if cached is not None:
+            log.info("Using cached data for %s (already scraped this month)", game)
+            all_dfs.append(cached)
+            successful_games += 1
+        else:
+            to_scrape.append((game, app_id))
+
+    results = asyncio.run(_scrape_all_steam_games(tuple(to_scrape))) if to_scrape else []
+
+    fallback_games = {}
+    for (game, app_id), result in zip(to_scrape, results):
+        if isinstance(result, BaseException):
+            log.error("%s failed over HTTP: %s", game, result)
+            fallback_games[game] = app_id
+        elif not result.empty:
+            all_dfs.append(result)
+            _store_cached_game(app_id, result)
+            successful_games += 1
+        else:
+            fallback_games[game] = app_id
+
+    # A real browser for the stragglers only (bot checks, layout changes)
+    if fallback_games:
+        successful_games += _scrape_fallback_games(fallback_games, all_dfs)
+
     try:
-        # Set up the driver
-        print("📱 Setting up Chrome driver...")
-        driver = setup_driver()
-        
-        # Add initial delay to avoid immediate rate limiting
-        print("⏳ Waiting 10 seconds before starting...")
-        time.sleep(10)
-        
-        # Scrape all games
-        all_data = []
-        total_games = len(steam_games)
-        successful_games = 0
-        
-        for i, (game, app_id) in enumerate(steam_games.items(), 1):
-            print(f"\n[{i}/{total_games}] Scraping {game}...")
-            
-            game_data = scrape_steamcharts(driver, app_id, game)
-            if game_data:
-                all_data.extend(game_data)
-                successful_games += 1
-            
-            # Add random delay between requests (except for the last game)
-            if i < total_games:
-                random_delay()
-        
-        # Convert to DataFrame and save
-        if all_data:
-            df = pd.DataFrame(all_data, columns=["Month", "Game", "Avg Players", "Peak Players"])
+        # Combine the per-game frames and save
+        if all_dfs:
+            df = pd.concat(all_dfs, ignore_index=True, copy=False)
+            # One vectorized parse per column, then drop rows that had no
+            # valid player counts (the old per-cell filter)
+            df["Avg Players"] = _parse_count_column(df["AvgRaw"])
+            df["Peak Players"] = _parse_count_column(df["PeakRaw"])
+            df = df[(df["Avg Players"] > 0) | (df["Peak Players"] > 0)]
+            df = df.drop(columns=["AvgRaw", "PeakRaw"]).reset_index(drop=True)
+            df = df[["Month", "Game", "Avg Players", "Peak Players"]]
             output_file = os.path.join("data", "steam_monthly_player_counts.csv")
-            df.to_csv(output_file, index=False)
-            print(f"\n✅ Successfully scraped {len(all_data)} records from {successful_games}/{total_games} games")
-            print(f"📁 Data saved to {output_file}")
-            
-            # Show some sample data
-            print("\n📊 Sample of scraped data:")
-            print(df.head(10))
-            
-            # Show summary by game
-            print("\n📈 Summary by game:")
-            game_summary = df.groupby('Game')['Avg Players'].max().sort_values(ascending=False)
-            print(game_summary.head(15))
-            
+            _write_counts_csv(df, output_file)
+            log.info("✅ Successfully scraped %d records from %d/%d games",
+                     len(df), successful_games, total_games)
+            log.info("📁 Data saved to %s", output_file)
+
+            # Show some sample data and a per-game summary
+            log.debug("Sample of scraped data:\n%s", df.head(10))
+            if log.isEnabledFor(logging.DEBUG):
+                game_summary = df.groupby('Game')['Avg Players'].max().sort_values(ascending=False)
+                log.debug("Summary by game:\n%s", game_summary.head(15))
+
             return df
         else:
-            print("\n❌ No data was scraped successfully")
+            log.error("❌ No data was scraped successfully")
             return pd.DataFrame()
-            
+
     except Exception as e:
-        print(f"\n💥 Unexpected error: {e}")
+        log.error("💥 Unexpected error: %s", e)
         return pd.DataFrame()
-    finally:
-        # Always close the driver
-        if driver:
-            print("\n🔒 Closing browser...")
-            driver.quit()
 
 
 if __name__ == "__main__":
-    scrape_steam_games() 
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    scrape_steam_games()
\ No newline at end of file
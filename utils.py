@@ -0,0 +1,68 @@
+"""Shared helpers for the scrapers."""
+
+import threading
+import time
+from functools import lru_cache
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by concurrent workers.
+
+    Allows bursts up to ``rate`` requests and refills continuously, so
+    callers only sleep when the bucket is actually empty instead of paying
+    a fixed delay between every request.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.per
+            self._tokens = min(self.rate, self._tokens + refill)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.per / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+# Strip thousands separators, percent signs and whitespace in one
+# C-level pass, replacing three chained str-method scans
+_STRIP = str.maketrans('', '', ',% \t\r\n')
+
+# Suffix multipliers for abbreviated counts like "87k" or "2.5M"
+_MULT = {'k': 1_000, 'm': 1_000_000, 'b': 1_000_000_000}
+
+
+@lru_cache(maxsize=4096)
+def parse_number_with_commas(text: str) -> float:
+    """Parse a player count like '1,234,567', '2.5M' or '87k' into a float.
+
+    Signed values (the '+872.4' / '-17128.7' gain columns) are not player
+    counts and parse to 0.0, as do empty or non-numeric cells. Results are
+    memoized because identical values recur across monthly table rows.
+    """
+    if not text:
+        return 0.0
+    cleaned = text.translate(_STRIP)
+    if not cleaned or cleaned[0] in '+-':
+        return 0.0
+    # Only the suffix character needs case-folding, not the whole string
+    multiplier = _MULT.get(cleaned[-1].lower(), 1)
+    if multiplier != 1:
+        cleaned = cleaned[:-1]
+    try:
+        return float(cleaned) * multiplier
+    except ValueError:
+        return 0.0